@@ -21,6 +21,9 @@ class BaseIon(object):
     :class:`Ion`.
     """
 
+    # Subclasses may use slots, so BaseIon does not add an instance dictionary.
+    __slots__ = ()
+
     _solvent = Aqueous
 
     _state = {'name': 'The name of the ion.',
@@ -64,7 +67,7 @@ class BaseIon(object):
                 else:
                     assert getattr(self, prop) == getattr(other, prop)
             return True
-        except:
+        except Exception:
             return False
 
     def serialize(self, nested=False, compact=False):
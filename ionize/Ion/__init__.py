@@ -68,48 +68,70 @@ class Ion(BaseIon):
               'molecular_weight': 'The ion molecular weight',
               'alias': 'Alternative chemical names.'}
 
-    # The reference properties of the ion are stored in private variables.
-    _valence = None
-    _reference_pKa = None
-    _reference_mobility = None
-    _reference_temperature = reference_temperature
-    _pKa = None
-    _absolute_mobility = None
-    _enthalpy = None
-    _heat_capacity = None
-    _nightingale_data = None
-    _molecular_weight = None
-    _alias = None
-
-    # Polynomial function is a derived parameter.
-    _nightingale_function = None
+    # Ions are created in large numbers by the Database and by Solutions, so
+    # their state is held in slots rather than in an instance dictionary.
+    __slots__ = (
+        # The reference properties of the ion are stored in private variables.
+        '_name', '_alias', '_valence', '_reference_pKa',
+        '_reference_mobility', '_reference_temperature', '_enthalpy',
+        '_heat_capacity', '_nightingale_data', '_molecular_weight',
+
+        # The context is set by BaseIon.context.
+        '_context',
+
+        # Polynomial function is a derived parameter.
+        '_nightingale_function',
+
+        # The valence states with the neutral state inserted, and the index of
+        # the neutral state, are derived from the valence. They are stored
+        # because they are used in every calculation.
+        '_valence_zero', '_neutral_index',
+
+        # The acidity at the reference temperature is used whenever there is
+        # no data to correct the pKa for temperature. It is computed on first
+        # use.
+        '_reference_acidity',
+
+        # The solvent viscosity at the reference temperature is used to
+        # correct the mobility for temperature. It is computed on first use.
+        '_reference_viscosity',
+
+        # Acidity products are memoized by ionic strength and temperature.
+        '_acidity_product_cache',
+    )
 
     def __init__(self, name, valence, reference_pKa, reference_mobility,
                  reference_temperature=None, enthalpy=None, heat_capacity=None,
                  nightingale_data=None, molecular_weight=None, alias=None):
         """Initialize an Ion object."""
+        self._context = None
 
         self._name = str(name)
-        if alias is not None:
-            self._alias = tuple(alias)
+        self._alias = None if alias is None else tuple(alias)
         self._valence = np.int_(valence)
 
         if len(self.valence) > 1:
             assert np.all(np.diff(self.valence) > 0), \
                 'Valences must be sorted.'
 
-        self._reference_pKa = np.float_(reference_pKa)
-        self._reference_mobility = np.float_(reference_mobility)
+        self._reference_pKa = np.float64(reference_pKa)
+        self._reference_acidity = None
+        self._reference_viscosity = None
+        self._reference_mobility = np.float64(reference_mobility)
 
-        if reference_temperature is not None:
+        if reference_temperature is None:
+            self._reference_temperature = BaseIon._reference_temperature
+        else:
             self._reference_temperature = float(reference_temperature)
 
+        self._enthalpy = None
         if enthalpy is not None:
-            self._enthalpy = np.float_(enthalpy)
+            self._enthalpy = np.float64(enthalpy)
             assert len(enthalpy) == len(self.reference_pKa)
 
+        self._heat_capacity = None
         if heat_capacity is not None:
-            self._heat_capacity = np.float_(heat_capacity)
+            self._heat_capacity = np.float64(heat_capacity)
 
         self._molecular_weight = molecular_weight
 
@@ -121,18 +143,42 @@ class Ion(BaseIon):
                 assert getattr(self, prop).shape == self.valence.shape, \
                     '{} must have the same shape as valence.'.format(prop)
 
+        # Valences are sorted, so the neutral state is inserted in place.
+        index_0 = self._neutral_index = int(self.valence.searchsorted(0))
+        self._valence_zero = np.concatenate((self.valence[:index_0], [0],
+                                             self.valence[index_0:]))
+        self._valence_zero.flags.writeable = False
+
+        # Each pKa links a state to its neighbor toward the neutral state, so
+        # the states must be consecutive and reach the neutral state. Valences
+        # are strictly increasing, so it is enough to check the span from the
+        # neutral state and that 0 is not a valence.
+        low, high = int(self.valence[0]), int(self.valence[-1])
+        assert (max(high, 0) - min(low, 0) == len(self.valence) and
+                (index_0 == len(self.valence) or
+                 self.valence[index_0] != 0)), \
+            'Valences must be consecutive.'
+        self._acidity_product_cache = {}
+
         assert np.all((self.reference_mobility / self.valence) > 0.), \
             'Mobilities must be signed. {}, {}'.format(self.reference_mobility,
                                                        self.valence)
 
+        self._nightingale_data = None
+        self._nightingale_function = None
         if nightingale_data is not None:
             self._nightingale_data = nightingale_data
             self._nightingale_function = \
                 np.poly1d(self.nightingale_data['fit'])
 
-    def _valence_zero(self):
-        """Create a list of charge states with 0 inserted."""
-        return np.sort(np.append(self.valence, [0]))
+    def __getstate__(self):
+        """Return the slot values, so that ions can be pickled."""
+        return dict((slot, getattr(self, slot)) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        """Restore the slot values of a pickled ion."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
 
     from .acidity import pKa, acidity, _clark_glew_pKa, \
         _clark_glew_acidity, _vant_hoff_acidity, _vant_hoff_pKa
@@ -22,10 +22,12 @@ def acidity(self, ionic_strength=None, temperature=None):
     else:
         if temperature != self.reference_temperature:
             warnings.warn('No data available to correct pKa for temperature.')
-        acidity = 10**(-self.reference_pKa)
+        if self._reference_acidity is None:
+            self._reference_acidity = 10.**(-self.reference_pKa)
+        acidity = self._reference_acidity
 
     # Correct for the activity of ion and H+
-    gam_i = self._solvent.activity(self._valence_zero(), ionic_strength, temperature)
+    gam_i = self._solvent.activity(self._valence_zero, ionic_strength, temperature)
     gam_h = self._solvent.activity(1, ionic_strength, temperature)
     acidity = acidity * gam_i[1:] / gam_i[:-1] / gam_h
 
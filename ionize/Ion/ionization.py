@@ -1,38 +1,71 @@
 from __future__ import division
+from math import log
 import numpy as np
 
+_acidity_product_cache_size = 32
+
 
 def ionization_fraction(self, pH=None, ionic_strength=None, temperature=None):
     """Return the fraction of time the ion is in each valence state.
 
     Value is returned as a numpy array. This array will not sum to 1 due to
     the fraction of ion in the uncharged state.
+
+    The pH may also be an array, in which case the fractions for every pH are
+    computed at once and returned with the valence states along the last axis.
+    The ionic strength must then be specified, either directly or through
+    the context.
     """
+    # Convert a sequence of pH first, so that the default ionic strength is
+    # not silently computed for pure water.
+    if np.ndim(pH) != 0:
+        pH = np.asarray(pH)
+
     pH, ionic_strength, temperature = \
         self._resolve_context(pH, ionic_strength, temperature)
 
     assert pH is not None, 'Calculation requires a pH.'
+    assert np.ndim(pH) == 0 or np.ndim(ionic_strength) == 0, \
+        'An array of pH requires a scalar ionic strength.'
 
-    # Compute the concentration of H+ from the pH.
-    cH = 10**(-pH)/self._solvent.activity(1, ionic_strength, temperature)
+    # Compute the log concentration of H+ from the pH, so that the power of
+    # cH for every valence state is evaluated as a single exponential.
+    log_cH = (-np.asarray(pH) * log(10.) -
+              log(self._solvent.activity(1, ionic_strength, temperature)))
 
-    # Calculate the numerator of the function for ionization fraction.
-    i_frac_vector = (self.acidity_product(ionic_strength, temperature) *
-                     cH ** self._valence_zero())
+    return _ionization_fraction(self.acidity_product(ionic_strength,
+                                                     temperature),
+                                self._valence_zero, log_cH)
 
-    # Filter out the neutral fraction
-    i_frac = i_frac_vector[self._valence_zero() != 0] / i_frac_vector.sum()
 
-    return i_frac
+def _ionization_fraction(acidity_product, valence_zero, log_cH):
+    """Return the ionization fraction from precomputed arrays.
+
+    Both acidity_product and valence_zero include the neutral state. log_cH is
+    the natural log of the concentration of H+, and may be an array.
+    """
+    # Calculate the numerator of the function for ionization fraction. The
+    # terms are scaled so the largest is 1, which keeps the sum from
+    # overflowing or underflowing at extreme pH.
+    log_i_frac = (np.log(acidity_product) +
+                  np.multiply.outer(log_cH, valence_zero))
+    i_frac_vector = np.exp(log_i_frac -
+                           log_i_frac.max(axis=-1, keepdims=True))
+
+    # Filter out the neutral fraction
+    return (i_frac_vector[..., valence_zero != 0] /
+            i_frac_vector.sum(axis=-1, keepdims=True))
 
 
 def charge(self, pH=None, ionic_strength=None, temperature=None, moment=1):
     """Return the time-averaged charge of the ion.
 
+    If the pH is an array, the charge is returned for each pH.
+
     :param moment: Control which moment average is returned. Default is 1.
     """
     fraction = self.ionization_fraction(pH, ionic_strength, temperature)
-    return np.sum(fraction * self.valence**moment)
+    return np.sum(fraction * self.valence**moment, axis=-1)
 
 
 def acidity_product(self, ionic_strength=None, temperature=None):
@@ -40,19 +73,38 @@ def acidity_product(self, ionic_strength=None, temperature=None):
 
     This vector, commonly referred to as L, is useful in computing the
     equilibrium pH in a solution, and to compute the ionization fraction of an
-    ion.
+    ion. The returned array is shared between calls, and is read-only.
     """
     _, ionic_strength, temperature = \
         self._resolve_context(None, ionic_strength, temperature)
 
-    Ka = self.acidity(ionic_strength, temperature).tolist()
-    index_0 = list(self._valence_zero()).index(0)
-    Ka.insert(index_0, 1)
+    # Ions are immutable, so L depends only on ionic strength and temperature.
+    # Solvers evaluate the same conditions repeatedly, so keep a small memo.
+    key = (ionic_strength, temperature)
+    cache = self._acidity_product_cache
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    # Clearing the memo when it is full keeps it bounded without the
+    # bookkeeping of a least-recently-used cache.
+    if len(cache) >= _acidity_product_cache_size:
+        cache.clear()
+
+    L = cache[key] = _acidity_product(self, ionic_strength, temperature)
+    return L
+
+
+def _acidity_product(self, ionic_strength, temperature):
+    Ka = self.acidity(ionic_strength, temperature)
+    index_0 = self._neutral_index
 
-    Lp = np.cumprod(Ka)
-    Lpp = np.cumprod(Ka[::-1])[::-1]
-    L = np.where(self._valence_zero() >= 0,
-                 Lp[self._valence_zero() == 0] / Lp,
-                 Lpp / Lpp[self._valence_zero() == 0])
+    # L is 1 for the neutral state. Negative states take the product of the
+    # acidities up to the neutral state, and positive states take the inverse.
+    L = np.ones(len(Ka) + 1)
+    L[:index_0] = np.cumprod(Ka[:index_0][::-1])[::-1]
+    L[index_0 + 1:] = 1. / np.cumprod(Ka[index_0:])
+    L.flags.writeable = False
 
     return L
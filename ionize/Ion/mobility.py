@@ -66,8 +66,11 @@ def absolute_mobility(self, temperature=None):
             warnings.warn('Temperature outside range'
                           'for nightingale data.')
     else:
+        if self._reference_viscosity is None:
+            self._reference_viscosity = \
+                self._solvent.viscosity(self.reference_temperature)
         absolute_mobility =\
-            (self._solvent.viscosity(self.reference_temperature) /
+            (self._reference_viscosity /
              self._solvent.viscosity(temperature)*self.reference_mobility)
 
     return absolute_mobility
@@ -84,17 +87,18 @@ def robinson_stokes_mobility(self, ionic_strength=None, temperature=None):
 
     dielectric = self._solvent.dielectric(temperature)
     viscosity = self._solvent.viscosity(temperature)
+    correction = _ionic_strength_correction(ionic_strength)
 
-    alpha = (5.799e5 * abs(self.valence) /
+    # Fold the scalar factors together before applying them to the states.
+    # abs(valence) * sign(valence) is the valence itself.
+    alpha = (5.799e5 * correction /
              (kelvin(temperature) * dielectric)**(3./2.)
              )
-    beta = (3.022588e-9 * abs(self.valence) / viscosity /
+    beta = (3.022588e-9 * correction / viscosity /
             (kelvin(temperature) * dielectric)**(1./2.))
 
     mobility = self.absolute_mobility(temperature)
-    mobility -= (alpha * mobility +
-                 beta * np.sign(self.valence)) * \
-        (sqrt(2 * ionic_strength) / (1. + pitts * sqrt(2 *ionic_strength)))
+    mobility -= alpha * abs(self.valence) * mobility + beta * self.valence
 
     return mobility
 
@@ -107,21 +111,27 @@ def onsager_fuoss_mobility(self):
     dielectric = self._solvent.dielectric(temperature)
     viscosity = self._solvent.viscosity(temperature)
     interaction = _interaction(self, self.context())
+    correction = _ionic_strength_correction(ionic_strength)
 
-    alpha = (1.98074e6 * abs(self.valence) * interaction /
+    alpha = (1.98074e6 * correction /
              (kelvin(temperature) * dielectric)**(3./2.)
              )
-    beta = (3.022588e-9 * abs(self.valence) / viscosity /
+    beta = (3.022588e-9 * correction / viscosity /
             (kelvin(temperature) * dielectric)**(1./2.))
 
     mobility = self.absolute_mobility()
-    mobility -= (alpha * mobility +
-                 beta * np.sign(self.valence)) * \
-        (sqrt(2 * ionic_strength) / (1. + pitts * sqrt(2 *ionic_strength)))
+    mobility -= (alpha * abs(self.valence) * interaction * mobility +
+                 beta * self.valence)
 
     return mobility
 
 
+def _ionic_strength_correction(ionic_strength):
+    """Return the ionic strength dependance shared by mobility corrections."""
+    root = sqrt(2 * ionic_strength)
+    return root / (1. + pitts * root)
+
+
 def _interaction(ion, solution):
     ions = [ion_ for ion_ in solution.ions
             if solution.concentration(ion_) > 0] + \
@@ -53,7 +53,7 @@ class Protein(IonComplex):
         temploc = tempfile.mkdtemp()
         try:
             file_ = lister.retrieve_pdb_file(self.name, pdir=temploc)
-        except:
+        except Exception:
             raise RuntimeError(
                 'Could not download {} from the PDB.'.format(self.name))
         structure = parser.get_structure(self.name, file_)
@@ -8,11 +8,6 @@ from ..constants import boltzmann, kelvin, reference_temperature, \
 from math import pi, exp
 import numpy as np
 
-from Bio import SeqUtils
-from Bio.SeqUtils.ProtParam import ProteinAnalysis
-from Bio.SeqUtils.IsoelectricPoint import IsoelectricPoint, positive_pKs, \
-    negative_pKs, pKcterminal, pKnterminal
-
 
 @fixed_state
 class Peptide(PolyIon):
@@ -35,12 +30,15 @@ class Peptide(PolyIon):
     _h = 5./6.
 
     def __init__(self, name=None, sequence=None):
+        from Bio.SeqUtils.ProtParam import ProteinAnalysis
+
         self._name = name
         self._sequence = sequence
         self._analysis = ProteinAnalysis(str(self.sequence))
 
     @property
     def molecular_weight(self):
+        from Bio import SeqUtils
         return SeqUtils.molecular_weight(self.sequence, 'protein')
 
     def charge(self, pH=None, ionic_strength=None, temperature=None,
@@ -51,6 +49,9 @@ class Peptide(PolyIon):
         :param ionic_strength
         :param temperature
         """
+        from Bio.SeqUtils.IsoelectricPoint import IsoelectricPoint, \
+            positive_pKs, negative_pKs, pKcterminal, pKnterminal
+
         pH, ionic_strength, temperature = \
             self._resolve_context(pH, ionic_strength, temperature)
 
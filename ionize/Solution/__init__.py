@@ -102,7 +102,7 @@ class Solution(object):
 
         try:
             len(concentrations)
-        except:
+        except TypeError:
             concentrations = (concentrations,)
 
         assert len(ions) == len(concentrations), \
@@ -189,12 +189,12 @@ class Solution(object):
         else:
             try:
                 ion, concentration = other
-                new_contents = dict(self._contents)
-                new_contents[ion] = self.concentration(ion) + concentration
-                return Solution(new_contents.keys(), new_contents.values())
-            except:
+            except (TypeError, ValueError):
                 raise TypeError('Solutions add to other Solutions or to an'
                                  '(Ion, concentration) iterable pair.')
+            new_contents = dict(self._contents)
+            new_contents[ion] = self.concentration(ion) + concentration
+            return Solution(new_contents.keys(), new_contents.values())
 
     __radd__ = __add__
 
@@ -224,7 +224,7 @@ class Solution(object):
     def __eq__(self, other):
         try:
             return self.serialize() == other.serialize()
-        except:
+        except Exception:
             return False
 
     def __contains__(self, other):
@@ -239,7 +239,7 @@ class Solution(object):
                 return self._name_lookup[item.name]
             else:
                 return self._name_lookup[item]
-        except:
+        except Exception:
             raise KeyError(item)
 
     def safe(self):
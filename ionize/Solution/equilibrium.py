@@ -1,7 +1,6 @@
 from __future__ import division
 import numpy as np
 from math import log10, sqrt
-from scipy.optimize import newton, brentq
 import warnings
 
 
@@ -46,7 +45,7 @@ def _calculate_pH(self, ionic_strength):
     # Construct P matrix
     PMat = []
     for i in range(n_ions):
-        z_list = np.resize(self.ions[i]._valence_zero(), [max_columns])
+        z_list = np.resize(self.ions[i]._valence_zero, [max_columns])
 
         Mmod = l_matrix.copy()
         Mmod[i, :] *= np.array(z_list)
@@ -110,6 +109,8 @@ def _equilibrate(self):
     adjusted activity coefficients. This function is called when the selfect is
     initialized.
     """
+    from scipy.optimize import newton, brentq
+
     if not [ion for ion in self.ions if hasattr(ion, 'valence')]:
         dissociation = self._solvent.dissociation(0, self.temperature())
         self._pH = -log10(sqrt(dissociation))
@@ -1,5 +1,4 @@
 from __future__ import division, print_function
-from scipy.optimize import newton, brentq, root
 import numpy as np
 import numbers
 import warnings
@@ -45,6 +44,8 @@ def titrate(self, titrant, target, titration_property='pH'):
     To titrate to a target property other than pH, simply set the property
     to a property of the Solution class.
     """
+    from scipy.optimize import brentq
+
     if isinstance(titrant, str):
         titrant = database.load(titrant)
 
@@ -72,6 +73,8 @@ def equilibrate_CO2(self, partial_pressure=atmospheric_CO2):
     :param partial_pressure: The partial pressure of CO2 in the atmosphere,
     in bar. Defaults to the typical value of Earth's atmosphere.
     """
+    from scipy.optimize import brentq
+
     CO2 = database['carbonic acid']
     eq = partial_pressure * self._solvent.henry_CO2(self.temperature())
 
@@ -92,6 +95,8 @@ def equilibrate_CO2(self, partial_pressure=atmospheric_CO2):
 
 def displace(self, receding, advancing=None):
     """Electrophoretically displace an ion."""
+    from scipy.optimize import root
+
     # Convert ion names to ions
     if isinstance(advancing, str):
         advancing = database[advancing]
@@ -62,7 +62,6 @@ class Solvent(object):
     def debye(self, ionic_strength, temperature):
         """Return the Debye length of the solvent."""
         dielectric = self.dielectric(temperature)
-        viscosity = self.viscosity(temperature)
         lamda = (dielectric * permittivity * boltzmann * kelvin(temperature) /
                  elementary_charge**2. /
                  (ionic_strength * lpm3) / avogadro) ** .5
@@ -16,7 +16,6 @@ def database():
 @cli.command()
 @click.argument('name')
 def ion(name):
-    new_ion = Database()[name]
     click.echo(Database()[name].serialize(nested=False, compact=True))
 
 
@@ -20,5 +20,5 @@ def encode(obj):
         return obj.tolist()
     try:
         return obj.serialize(nested=True)
-    except:
+    except Exception:
         return json.JSONEncoder().default(obj)
@@ -12,9 +12,13 @@ from .__main__ import cli
 import unittest
 import warnings
 import numpy as np
+import pickle
 from copy import copy
 from click.testing import CliRunner
 
+# Loading the database parses the full JSON file, so share one copy.
+database = Database()
+
 
 class TestAqueous(unittest.TestCase):
 
@@ -72,11 +76,22 @@ class TestAqueous(unittest.TestCase):
     def test_pKs(self):
         self.aqueous.pKs(0.01, 25)
 
+    def test_array_temperature(self):
+        """Test that array temperatures match scalar evaluation."""
+        temperature = np.array([10., 25., 40.])
+        np.testing.assert_allclose(self.aqueous.debye_huckel(temperature),
+                                   [self.aqueous.debye_huckel(t)
+                                    for t in temperature])
+        np.testing.assert_allclose(self.aqueous.activity(1, .01, temperature),
+                                   [self.aqueous.activity(1, .01, t)
+                                    for t in temperature])
+
 
 class TestIon(unittest.TestCase):
 
-    def setUp(self):
-        self.database = Database()
+    @classmethod
+    def setUpClass(cls):
+        cls.database = database
         warnings.filterwarnings('ignore')
 
     def test_malformed(self):
@@ -125,6 +140,33 @@ class TestIon(unittest.TestCase):
                         ion.mobility(pH, I, T)
                         ion.diffusivity(pH, I, T)
 
+    def test_ionization_fraction_array(self):
+        """Test that an array of pH matches scalar evaluation."""
+        pH_list = np.linspace(0, 14, 15)
+        for ion_name in self.database.keys():
+            ion = self.database.load(ion_name)
+            fraction = ion.ionization_fraction(pH_list, .01)
+            self.assertEqual(fraction.shape, (len(pH_list), len(ion.valence)))
+            for pH, row in zip(pH_list, fraction):
+                np.testing.assert_allclose(row,
+                                           ion.ionization_fraction(pH, .01))
+            np.testing.assert_allclose(ion.charge(pH_list, .01),
+                                       [ion.charge(pH, .01)
+                                        for pH in pH_list])
+
+        ion = self.database.load('histidine')
+        for pH in (np.array([3., 5.]), [3., 5.]):
+            with self.assertRaises(AssertionError):
+                ion.ionization_fraction(pH)
+
+    def test_extreme_pH(self):
+        """Test that ionization fractions stay finite at extreme pH."""
+        ion = self.database.load('citric acid')
+        for pH in (-300, 400):
+            fraction = ion.ionization_fraction(pH, .01)
+            self.assertTrue(np.all(np.isfinite(fraction)))
+            self.assertLessEqual(np.sum(fraction), 1.)
+
     def test_equality(self):
         hcl = self.database.load('hydrochloric acid')
         hcl2 = self.database.load('hydrochloric acid')
@@ -138,11 +180,24 @@ class TestIon(unittest.TestCase):
             self.assertEqual(ion, deserialize(ion.serialize()),
                              'Deserializing {} failed.'.format(ion_name))
 
+    def test_pickle(self):
+        ion = self.database.load('histidine')
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(ion, pickle.loads(pickle.dumps(ion, protocol)),
+                             'Pickling with protocol {} failed.'
+                             .format(protocol))
+
     def test_order(self):
         """Ensures that valence order is enforced."""
         with self.assertRaises(AssertionError):
             Ion('badIon', [3, 1, 2], [0, 0, 0], [0, 0, 0])
 
+    def test_consecutive(self):
+        """Ensures that valences without gaps are enforced."""
+        for valence in ([1, 3], [-2, 1], [2, 3]):
+            with self.assertRaises(AssertionError):
+                Ion('badIon', valence, [5, 7], np.sign(valence) * 1e-9)
+
     def test_immutable(self):
         """Test that parts of ion state are immutable."""
         ion = self.database.load('histidine')
@@ -160,7 +215,7 @@ class TestIon(unittest.TestCase):
         ref = self.database['tris']
         for name in ['tris', 'bis-tris', 'hydrochloric acid']:
             other = self.database[name]
-            if name is not 'tris':
+            if name != 'tris':
                 self.assertGreater(ref.separability(other, pH=8), 0)
             else:
                 self.assertAlmostEqual(ref.separability(other, pH=8), 0)
@@ -182,8 +237,9 @@ class TestIon(unittest.TestCase):
 
 class TestDatabase(unittest.TestCase):
 
-    def setUp(self):
-        self.database = Database()
+    @classmethod
+    def setUpClass(cls):
+        cls.database = database
         warnings.filterwarnings('ignore')
 
     def test_import(self):
@@ -231,20 +287,20 @@ class TestSolution(unittest.TestCase):
         self.assertNotEqual(buf.transference('hydrochloric acid'), 0,
                             'HCl should have a non-zero '
                             'transference number.')
-        self.assertNotEqual(buf.transference(Database()['tris']), 0,
+        self.assertNotEqual(buf.transference(database['tris']), 0,
                             'Tris should have a non-zero '
                             'transference number.')
-        self.assertEqual(buf.transference(Database()['bis-tris']), 0)
+        self.assertEqual(buf.transference(database['bis-tris']), 0)
 
     def test_zone_transfer(self):
         buf = self.solutions[-2]
         self.assertNotEqual(buf.zone_transfer('hydrochloric acid'), 0,
                             'HCl should have a non-zero '
                             'transference number.')
-        self.assertNotEqual(buf.zone_transfer(Database()['tris']), 0,
+        self.assertNotEqual(buf.zone_transfer(database['tris']), 0,
                             'Tris should have a non-zero '
                             'transference number.')
-        self.assertNotEqual(buf.zone_transfer(Database()['bis-tris']), 0)
+        self.assertNotEqual(buf.zone_transfer(database['bis-tris']), 0)
 
     def test_conservation_functions(self):
         for buf in self.solutions:
@@ -253,6 +309,12 @@ class TestSolution(unittest.TestCase):
             buf.jovin()
             buf.gas()
 
+    def test_scalar_concentration(self):
+        """Test that scalar concentrations of any type are accepted."""
+        pH = Solution(['tris'], [0.1]).pH
+        for concentration in (0.1, np.float64(0.1), np.array(0.1)):
+            self.assertAlmostEqual(Solution('tris', concentration).pH, pH)
+
     def test_water_properties(self):
         water = Solution([], [])
         self.assertAlmostEqual(water.pH, 7.0, 2)
@@ -285,7 +347,7 @@ class TestSolution(unittest.TestCase):
         sol = Solution(['tris', 'hydrochloric acid'],
                        [0.1, 0.05])
 
-        self.assertEqual(sol['tris'], sol[Database()['tris']],
+        self.assertEqual(sol['tris'], sol[database['tris']],
                          'Failed to get equivilent items from solution.')
 
     def test_repr(self):
@@ -4,7 +4,7 @@ from setuptools import setup, find_packages
 try:
     import pypandoc
     long_description = pypandoc.convert('README.md', 'rst')
-except:
+except Exception:
     long_description = None
 
 # Read version from package.